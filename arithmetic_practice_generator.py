@@ -6,70 +6,261 @@ and powers of ten (scientific notation) problems.
 Styled like Pearson Education textbook worksheets
 """
 
+import io
+import math
+import os
 import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.pdfgen import canvas
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
 
+# Layout distances in points, folded once at import
+(_P05, _P10, _P15, _P25, _P30, _P35, _P40, _P50, _P55, _P75, _P100, _P150) = (
+    inch * x for x in (0.05, 0.1, 0.15, 0.25, 0.3, 0.35, 0.4, 0.5, 0.55, 0.75, 1, 1.5))
+
+# Worksheet palette
+_C_NAVY = colors.HexColor('#1a365d')      # titles, rules, problem numbers
+_C_SLATE = colors.HexColor('#cbd5e0')     # separator and answer lines
+_C_GREY = colors.HexColor('#718096')      # footer text, answer labels
+_C_RED = colors.HexColor('#c53030')       # answer key answers
+_C_DARK = colors.HexColor('#2d3748')      # name/date fields
+_C_SUBTEXT = colors.HexColor('#4a5568')   # subtitles
+_C_LIGHT = colors.HexColor('#e2e8f0')     # answer boxes
+
 # Unicode superscript digits for exponents
 SUPERSCRIPT_MAP = {
     '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
     '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
     '-': '⁻', '+': '⁺'
 }
+_SUPER_TABLE = str.maketrans(SUPERSCRIPT_MAP)
+
+
+def _divisor_table(limit):
+    """Map each product of two single-digit operands to its divisors in [2, limit)."""
+    return {p: tuple(d for d in range(2, limit) if p % d == 0) for p in range(4, 82)}
+
+
+# Divisors used to pick clean denominators in advanced powers problems
+_DIVISORS_20 = _divisor_table(20)
+_DIVISORS_10 = _divisor_table(10)
+_DIVISORS_12 = _divisor_table(12)
+
+
+def _normalize(coef, exp):
+    """Shift a positive coefficient into [1, 10), adjusting the exponent to match."""
+    if coef <= 0:
+        return coef, exp
+    k = math.floor(math.log10(coef))
+    if k > 0:
+        coef = coef / 10.0 ** k
+    elif k < 0:
+        coef = coef * 10.0 ** -k
+    return coef, exp + k
+
+
+def _fmt(x):
+    """Format a coefficient without trailing zeros (``7.0`` -> ``7``, ``2.50`` -> ``2.5``)."""
+    return str(int(x)) if float(x).is_integer() else format(x, 'g')
+
+
+@dataclass(slots=True)
+class Problem:
+    """A vertical arithmetic problem: ``top <operation> bottom = answer``."""
+    top: int
+    bottom: int
+    operation: str
+    answer: int
+
+
+@dataclass(slots=True)
+class PowerProblem:
+    """
+    A powers of ten problem.
+
+    ``expression`` is the problem text, or a ``{'numerator', 'denominator'}``
+    dict when ``is_fraction`` is set.
+    """
+    expression: str | dict
+    answer: str
+    is_horizontal: bool
+    has_division: bool
+    is_fraction: bool = False
+    answer_scientific: str | None = None
+
+
+def _batch_add(rng, n, min_val, max_val, allow_negative_results):
+    """``n`` addition problems with operands in [min_val, max_val]."""
+    tops = rng.choices(range(min_val, max_val + 1), k=n)
+    bottoms = rng.choices(range(min_val, max_val + 1), k=n)
+    return tops, bottoms, [a + b for a, b in zip(tops, bottoms)]
+
+
+def _batch_sub(rng, n, min_val, max_val, allow_negative_results):
+    """``n`` subtraction problems; non-negative unless allow_negative_results."""
+    tops = rng.choices(range(min_val, max_val + 1), k=n)
+    if allow_negative_results:
+        bottoms = rng.choices(range(min_val, max_val + 1), k=n)
+    else:
+        bottoms = [rng.randint(min_val, a) for a in tops]
+    return tops, bottoms, [a - b for a, b in zip(tops, bottoms)]
+
+
+def _batch_mul(rng, n, min_val, max_val, allow_negative_results):
+    """``n`` multiplication problems within the times tables (factors up to 12)."""
+    tops = rng.choices(range(min_val, min(max_val, 12) + 1), k=n)
+    bottoms = rng.choices(range(min_val, min(max_val, 12) + 1), k=n)
+    return tops, bottoms, [a * b for a, b in zip(tops, bottoms)]
+
+
+def _batch_div(rng, n, min_val, max_val, allow_negative_results):
+    """``n`` division problems with whole-number quotients up to 12."""
+    bottoms = rng.choices(range(max(1, min_val), min(max_val, 12) + 1), k=n)
+    answers = rng.choices(range(min_val, min(max_val, 12) + 1), k=n)
+    return [b * q for b, q in zip(bottoms, answers)], bottoms, answers
+
+
+# Every accepted spelling of an operation -> (printed symbol, batch generator).
+# Each generator takes the random.Random instance to draw from and returns
+# parallel (tops, bottoms, answers) lists.
+_OP_BATCH = {
+    '+': ('+', _batch_add),
+    '-': ('-', _batch_sub),
+    '×': ('×', _batch_mul), '*': ('×', _batch_mul),
+    '÷': ('÷', _batch_div), '/': ('÷', _batch_div),
+}
+
+
+def _write_pdf(target, data, label):
+    """
+    Write rendered PDF bytes to a path or a writable binary file object.
+
+    Only writes to a path are reported, as ``"<label> saved to: <path>"``.
+    """
+    if hasattr(target, 'write'):
+        target.write(data)
+    else:
+        with open(target, 'wb') as f:
+            f.write(data)
+        print(f"{label} saved to: {target}")
+
+
+# Font metrics are a pure function of (text, font, size); most strings
+# (titles, dates, page labels) repeat on every page.
+_sw = lru_cache(maxsize=4096)(stringWidth)
 
 
 def to_superscript(num):
     """Convert a number to superscript unicode characters."""
-    return ''.join(SUPERSCRIPT_MAP.get(c, c) for c in str(num))
+    return str(num).translate(_SUPER_TABLE)
+
+
+class _FastCanvas(canvas.Canvas):
+    """
+    Canvas that skips font, colour and line-width operators when the
+    requested value is already in effect.
+
+    The last value emitted for each setting is kept alongside reportlab's own
+    graphics state, so it is saved/restored with saveState()/restoreState()
+    and reset at the start of every page.
+    """
+
+    STATE_ATTRIBUTES = canvas.Canvas.STATE_ATTRIBUTES + [
+        '_font_state', '_fill_state', '_stroke_state', '_width_state']
+
+    def init_graphics_state(self):
+        super().init_graphics_state()
+        self._font_state = self._fill_state = None
+        self._stroke_state = self._width_state = None
+
+    def setFont(self, psfontname, size, leading=None):
+        key = (psfontname, size, size * 1.2 if leading is None else leading)
+        if key != self._font_state:
+            self._font_state = key
+            super().setFont(psfontname, size, leading)
+
+    def setFillColor(self, aColor, alpha=None):
+        if alpha is not None:
+            self._fill_state = None
+        elif aColor == self._fill_state:
+            return
+        else:
+            self._fill_state = aColor
+        super().setFillColor(aColor, alpha)
+
+    def setStrokeColor(self, aColor, alpha=None):
+        if alpha is not None:
+            self._stroke_state = None
+        elif aColor == self._stroke_state:
+            return
+        else:
+            self._stroke_state = aColor
+        super().setStrokeColor(aColor, alpha)
+
+    def setLineWidth(self, width):
+        if width != self._width_state:
+            self._width_state = width
+            super().setLineWidth(width)
+
+    def drawText(self, aTextObject):
+        super().drawText(aTextObject)
+        # A text object's font and fill operators stay in effect after it
+        # ends, so adopt them as the canvas's own state.
+        self._fontname = aTextObject._fontname
+        self._fontsize = aTextObject._fontsize
+        self._leading = aTextObject._leading
+        self._font_state = (self._fontname, self._fontsize, self._leading)
+        fill = aTextObject.__dict__.get('_fillColorObj')
+        if fill is not None:
+            self._fillColorObj = self._fill_state = fill
 
 
 class ArithmeticPracticeGenerator:
     """Generates professional arithmetic practice sheets."""
 
-    def __init__(self, school_name="Lexington Science Academy"):
+    def __init__(self, school_name="Lexington Science Academy", seed=None):
         self.school_name = school_name
+        # Private random source; pass a seed for reproducible worksheets
+        self._rng = random.Random(seed)
         self.page_width, self.page_height = letter
-        self.margin = 0.75 * inch
+        self.margin = _P75
         self.problems_per_row = 5
         self.rows_per_page = 6
 
     def generate_problem(self, operation='+', min_val=1, max_val=99,
                          allow_negative_results=False):
         """Generate a single arithmetic problem."""
-        if operation == '+':
-            a = random.randint(min_val, max_val)
-            b = random.randint(min_val, max_val)
-            answer = a + b
-        elif operation == '-':
-            if allow_negative_results:
-                a = random.randint(min_val, max_val)
-                b = random.randint(min_val, max_val)
-            else:
-                a = random.randint(min_val, max_val)
-                b = random.randint(min_val, a)
-            answer = a - b
-        elif operation == '*' or operation == '×':
-            a = random.randint(min_val, min(max_val, 12))
-            b = random.randint(min_val, min(max_val, 12))
-            answer = a * b
-            operation = '×'
-        elif operation == '/' or operation == '÷':
-            b = random.randint(max(1, min_val), min(max_val, 12))
-            answer = random.randint(min_val, min(max_val, 12))
-            a = b * answer
-            operation = '÷'
-        else:
-            raise ValueError(f"Unknown operation: {operation}")
+        columns = self._generate_problems_batch(1, operation, min_val, max_val,
+                                                allow_negative_results)
+        return Problem(columns['top'][0], columns['bottom'][0],
+                       columns['operation'][0], columns['answer'][0])
+
+    def _generate_problems_batch(self, n, operation, min_val, max_val,
+                                 allow_negative_results=False):
+        """
+        Generate ``n`` problems for a single operation.
 
-        return {'top': a, 'bottom': b, 'operation': operation, 'answer': answer}
+        Each operand column is drawn with one ``choices`` call rather
+        than two ``randint`` calls per problem. The problems are returned as
+        parallel columns: a dict of ``'top'``, ``'bottom'``, ``'operation'``
+        and ``'answer'`` lists, where index ``i`` of each list is problem ``i``.
+        """
+        try:
+            symbol, generate = _OP_BATCH[operation]
+        except KeyError:
+            raise ValueError(f"Unknown operation: {operation}") from None
+        tops, bottoms, answers = generate(self._rng, n, min_val, max_val,
+                                          allow_negative_results)
+        return {'top': tops, 'bottom': bottoms, 'operation': [symbol] * n,
+                'answer': answers}
 
     def generate_powers_of_ten_problem(self, level='intermediate'):
         """
@@ -92,12 +283,12 @@ class ArithmeticPracticeGenerator:
 
     def _generate_basic_powers_problem(self):
         """Generate basic powers of ten problems."""
-        problem_type = random.choice(['single', 'multiply_two'])
+        problem_type = self._rng.choice(['single', 'multiply_two'])
 
         if problem_type == 'single':
             # Simple: coefficient × 10^exp
-            coef = random.randint(1, 9)
-            exp = random.randint(-3, 6)
+            coef = self._rng.randint(1, 9)
+            exp = self._rng.randint(-3, 6)
 
             expression = f"{coef} × 10{to_superscript(exp)}"
             answer_val = coef * (10 ** exp)
@@ -108,19 +299,19 @@ class ArithmeticPracticeGenerator:
             else:
                 answer = f"{answer_val:.{abs(exp)}f}".rstrip('0').rstrip('.')
 
-            return {
-                'expression': expression,
-                'answer': answer,
-                'answer_scientific': f"{coef} × 10{to_superscript(exp)}",
-                'is_horizontal': True,
-                'has_division': False
-            }
+            return PowerProblem(
+                expression=expression,
+                answer=answer,
+                answer_scientific=f"{coef} × 10{to_superscript(exp)}",
+                is_horizontal=True,
+                has_division=False
+            )
         else:
             # Multiply two: (a × 10^m) × (b × 10^n)
-            a = random.randint(1, 9)
-            b = random.randint(1, 9)
-            m = random.randint(1, 4)
-            n = random.randint(1, 4)
+            a = self._rng.randint(1, 9)
+            b = self._rng.randint(1, 9)
+            m = self._rng.randint(1, 4)
+            n = self._rng.randint(1, 4)
 
             expression = f"({a} × 10{to_superscript(m)}) × ({b} × 10{to_superscript(n)})"
 
@@ -128,31 +319,26 @@ class ArithmeticPracticeGenerator:
             result_coef = a * b
             result_exp = m + n
 
-            # Normalize if coefficient >= 10
-            if result_coef >= 10:
-                result_coef = result_coef / 10
-                result_exp += 1
+            # Normalize
+            result_coef, result_exp = _normalize(result_coef, result_exp)
 
-            if result_coef == int(result_coef):
-                answer = f"{int(result_coef)} × 10{to_superscript(result_exp)}"
-            else:
-                answer = f"{result_coef} × 10{to_superscript(result_exp)}"
+            answer = f"{_fmt(result_coef)} × 10{to_superscript(result_exp)}"
 
-            return {
-                'expression': expression,
-                'answer': answer,
-                'is_horizontal': True,
-                'has_division': False
-            }
+            return PowerProblem(
+                expression=expression,
+                answer=answer,
+                is_horizontal=True,
+                has_division=False
+            )
 
     def _generate_intermediate_powers_problem(self):
         """Generate intermediate powers of ten problems."""
-        problem_type = random.choice(['multiply', 'divide'])
+        problem_type = self._rng.choice(['multiply', 'divide'])
 
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
-        m = random.randint(-3, 5)
-        n = random.randint(-3, 5)
+        a = self._rng.randint(2, 9)
+        b = self._rng.randint(2, 9)
+        m = self._rng.randint(-3, 5)
+        n = self._rng.randint(-3, 5)
 
         if problem_type == 'multiply':
             expression = f"({a} × 10{to_superscript(m)}) × ({b} × 10{to_superscript(n)})"
@@ -161,12 +347,12 @@ class ArithmeticPracticeGenerator:
             has_division = False
         else:
             # Ensure clean division
-            result = random.randint(2, 9)
-            b = random.randint(2, 9)
+            result = self._rng.randint(2, 9)
+            b = self._rng.randint(2, 9)
             a = result * b
             if a > 9:
-                a = random.randint(2, 9)
-                b = random.choice([c for c in range(1, 10) if a % c == 0])
+                a = self._rng.randint(2, 9)
+                b = self._rng.choice([c for c in range(1, 10) if a % c == 0])
                 result = a // b
 
             expression = f"({a} × 10{to_superscript(m)}) ÷ ({b} × 10{to_superscript(n)})"
@@ -175,41 +361,33 @@ class ArithmeticPracticeGenerator:
             has_division = True
 
         # Normalize
-        while result_coef >= 10:
-            result_coef /= 10
-            result_exp += 1
-        while 0 < result_coef < 1:
-            result_coef *= 10
-            result_exp -= 1
-
-        if result_coef == int(result_coef):
-            answer = f"{int(result_coef)} × 10{to_superscript(result_exp)}"
-        else:
-            answer = f"{result_coef:.2f}".rstrip('0').rstrip('.') + f" × 10{to_superscript(result_exp)}"
+        result_coef, result_exp = _normalize(result_coef, result_exp)
 
-        return {
-            'expression': expression,
-            'answer': answer,
-            'is_horizontal': not has_division,
-            'has_division': has_division
-        }
+        answer = f"{_fmt(result_coef)} × 10{to_superscript(result_exp)}"
+
+        return PowerProblem(
+            expression=expression,
+            answer=answer,
+            is_horizontal=not has_division,
+            has_division=has_division
+        )
 
     def _generate_advanced_powers_problem(self):
         """Generate advanced powers of ten problems with complex expressions."""
-        problem_type = random.choice(['fraction', 'multi_term', 'complex_fraction'])
+        problem_type = self._rng.choice(['fraction', 'multi_term', 'complex_fraction'])
 
         if problem_type == 'fraction':
             # (a × 10^m × b × 10^n) ÷ c
-            a = random.randint(2, 9)
-            b = random.randint(2, 8)
-            m = random.randint(2, 6)
-            n = random.randint(-3, 3)
+            a = self._rng.randint(2, 9)
+            b = self._rng.randint(2, 8)
+            m = self._rng.randint(2, 6)
+            n = self._rng.randint(-3, 3)
 
             # Choose c to divide evenly
             product = a * b
-            divisors = [d for d in range(2, 20) if product % d == 0]
+            divisors = _DIVISORS_20[product]
             if divisors:
-                c = random.choice(divisors)
+                c = self._rng.choice(divisors)
             else:
                 c = 1
 
@@ -220,15 +398,15 @@ class ArithmeticPracticeGenerator:
 
         elif problem_type == 'multi_term':
             # (a × 10^m) × (b × 10^n) ÷ (c × 10^p)
-            a = random.randint(2, 9)
-            b = random.randint(2, 9)
-            m = random.randint(2, 5)
-            n = random.randint(-2, 3)
-            p = random.randint(-2, 4)
+            a = self._rng.randint(2, 9)
+            b = self._rng.randint(2, 9)
+            m = self._rng.randint(2, 5)
+            n = self._rng.randint(-2, 3)
+            p = self._rng.randint(-2, 4)
 
             product = a * b
-            divisors = [d for d in range(2, 10) if product % d == 0]
-            c = random.choice(divisors) if divisors else random.randint(2, 5)
+            divisors = _DIVISORS_10[product]
+            c = self._rng.choice(divisors) if divisors else self._rng.randint(2, 5)
 
             expression = f"({a} × 10{to_superscript(m)}) × ({b} × 10{to_superscript(n)}) ÷ ({c} × 10{to_superscript(p)})"
 
@@ -236,15 +414,15 @@ class ArithmeticPracticeGenerator:
             result_exp = m + n - p
 
         else:  # complex_fraction - displayed as vertical fraction
-            a = random.randint(2, 9)
-            b = random.randint(2, 9)
-            m = random.randint(3, 6)
-            n = random.randint(-2, 3)
+            a = self._rng.randint(2, 9)
+            b = self._rng.randint(2, 9)
+            m = self._rng.randint(3, 6)
+            n = self._rng.randint(-2, 3)
 
             product = a * b
-            divisors = [d for d in range(2, 12) if product % d == 0]
-            c = random.choice(divisors) if divisors else random.randint(2, 6)
-            p = random.randint(1, 4)
+            divisors = _DIVISORS_12[product]
+            c = self._rng.choice(divisors) if divisors else self._rng.randint(2, 6)
+            p = self._rng.randint(1, 4)
 
             # Numerator and denominator for vertical display
             numerator = f"{a} × 10{to_superscript(m)} × {b} × 10{to_superscript(n)}"
@@ -256,152 +434,156 @@ class ArithmeticPracticeGenerator:
             result_exp = m + n - p
 
             # Normalize
-            while result_coef >= 10:
-                result_coef /= 10
-                result_exp += 1
-            while 0 < result_coef < 1:
-                result_coef *= 10
-                result_exp -= 1
-
-            if result_coef == int(result_coef):
-                answer = f"{int(result_coef)} × 10{to_superscript(result_exp)}"
-            else:
-                answer = f"{result_coef:.2f}".rstrip('0').rstrip('.') + f" × 10{to_superscript(result_exp)}"
-
-            return {
-                'expression': expression,
-                'answer': answer,
-                'is_horizontal': False,
-                'has_division': True,
-                'is_fraction': True
-            }
+            result_coef, result_exp = _normalize(result_coef, result_exp)
+
+            answer = f"{_fmt(result_coef)} × 10{to_superscript(result_exp)}"
+
+            return PowerProblem(
+                expression=expression,
+                answer=answer,
+                is_horizontal=False,
+                has_division=True,
+                is_fraction=True
+            )
 
         # Normalize
-        while result_coef >= 10:
-            result_coef /= 10
-            result_exp += 1
-        while 0 < result_coef < 1:
-            result_coef *= 10
-            result_exp -= 1
-
-        if result_coef == int(result_coef):
-            answer = f"{int(result_coef)} × 10{to_superscript(result_exp)}"
-        else:
-            answer = f"{result_coef:.2f}".rstrip('0').rstrip('.') + f" × 10{to_superscript(result_exp)}"
+        result_coef, result_exp = _normalize(result_coef, result_exp)
 
-        return {
-            'expression': expression,
-            'answer': answer,
-            'is_horizontal': False,
-            'has_division': True,
-            'is_fraction': False
-        }
+        answer = f"{_fmt(result_coef)} × 10{to_superscript(result_exp)}"
+
+        return PowerProblem(
+            expression=expression,
+            answer=answer,
+            is_horizontal=False,
+            has_division=True,
+            is_fraction=False
+        )
 
     def create_header_footer(self, canvas_obj, doc, page_num, total_pages,
-                            worksheet_title, worksheet_subtitle=""):
-        """Draw professional header and footer on each page."""
+                            worksheet_title, worksheet_subtitle="", sheet_id=None,
+                            date_str=None, year=None):
+        """
+        Draw professional header and footer on each page.
+
+        ``sheet_id`` labels the footer, ``date_str`` is the header date and
+        ``year`` the copyright year; callers pass the same values for every
+        page of a worksheet. Any that are omitted are filled in from a random
+        identifier or the current date.
+        """
         canvas_obj.saveState()
 
         # === HEADER ===
-        header_y = self.page_height - 0.5 * inch
-
-        # Top decorative line
-        canvas_obj.setStrokeColor(colors.HexColor('#1a365d'))
-        canvas_obj.setLineWidth(2)
-        canvas_obj.line(self.margin, header_y + 0.15*inch,
-                       self.page_width - self.margin, header_y + 0.15*inch)
+        header_y = self.page_height - _P50
 
         # School name (left side)
-        canvas_obj.setFillColor(colors.HexColor('#1a365d'))
+        canvas_obj.setFillColor(_C_NAVY)
         canvas_obj.setFont('Helvetica-Bold', 12)
-        canvas_obj.drawString(self.margin, header_y - 0.1*inch, self.school_name)
+        canvas_obj.drawString(self.margin, header_y - _P10, self.school_name)
 
         # Worksheet title (center)
         canvas_obj.setFont('Helvetica-Bold', 16)
-        title_width = canvas_obj.stringWidth(worksheet_title, 'Helvetica-Bold', 16)
-        canvas_obj.drawString((self.page_width - title_width) / 2, header_y - 0.1*inch,
+        title_width = _sw(worksheet_title, 'Helvetica-Bold', 16)
+        canvas_obj.drawString((self.page_width - title_width) / 2, header_y - _P10,
                              worksheet_title)
 
         # Date (right side)
-        date_str = datetime.now().strftime("%B %d, %Y")
+        if date_str is None:
+            date_str = datetime.now().strftime("%B %d, %Y")
         canvas_obj.setFont('Helvetica', 10)
-        date_width = canvas_obj.stringWidth(date_str, 'Helvetica', 10)
+        date_width = _sw(date_str, 'Helvetica', 10)
         canvas_obj.drawString(self.page_width - self.margin - date_width,
-                             header_y - 0.1*inch, date_str)
+                             header_y - _P10, date_str)
 
         # Subtitle if provided
         if worksheet_subtitle:
             canvas_obj.setFont('Helvetica-Oblique', 10)
-            canvas_obj.setFillColor(colors.HexColor('#4a5568'))
-            sub_width = canvas_obj.stringWidth(worksheet_subtitle, 'Helvetica-Oblique', 10)
+            canvas_obj.setFillColor(_C_SUBTEXT)
+            sub_width = _sw(worksheet_subtitle, 'Helvetica-Oblique', 10)
             canvas_obj.drawString((self.page_width - sub_width) / 2,
-                                 header_y - 0.35*inch, worksheet_subtitle)
-
-        # Header bottom line
-        canvas_obj.setStrokeColor(colors.HexColor('#cbd5e0'))
-        canvas_obj.setLineWidth(0.5)
-        canvas_obj.line(self.margin, header_y - 0.5*inch,
-                       self.page_width - self.margin, header_y - 0.5*inch)
+                                 header_y - _P35, worksheet_subtitle)
 
         # Name and Date fields
-        canvas_obj.setFillColor(colors.HexColor('#2d3748'))
+        canvas_obj.setFillColor(_C_DARK)
         canvas_obj.setFont('Helvetica', 10)
-        canvas_obj.drawString(self.margin, header_y - 0.75*inch, "Name: _______________________________")
-        canvas_obj.drawString(self.page_width/2 + 0.5*inch, header_y - 0.75*inch,
+        canvas_obj.drawString(self.margin, header_y - _P75, "Name: _______________________________")
+        canvas_obj.drawString(self.page_width/2 + _P50, header_y - _P75,
                              "Date: ________________    Score: ______ / ______")
 
         # === FOOTER ===
-        footer_y = 0.5 * inch
-
-        # Footer top line
-        canvas_obj.setStrokeColor(colors.HexColor('#cbd5e0'))
-        canvas_obj.setLineWidth(0.5)
-        canvas_obj.line(self.margin, footer_y + 0.25*inch,
-                       self.page_width - self.margin, footer_y + 0.25*inch)
+        footer_y = _P50
 
         # Copyright/Attribution (left)
-        canvas_obj.setFillColor(colors.HexColor('#718096'))
+        if year is None:
+            year = datetime.now().year
+        canvas_obj.setFillColor(_C_GREY)
         canvas_obj.setFont('Helvetica', 8)
         canvas_obj.drawString(self.margin, footer_y,
-                             f"© {datetime.now().year} {self.school_name} | Mathematics Department")
+                             f"© {year} {self.school_name} | Mathematics Department")
 
         # Page number (center)
         canvas_obj.setFont('Helvetica-Bold', 10)
         page_text = f"Page {page_num} of {total_pages}"
-        page_width = canvas_obj.stringWidth(page_text, 'Helvetica-Bold', 10)
-        canvas_obj.setFillColor(colors.HexColor('#1a365d'))
+        page_width = _sw(page_text, 'Helvetica-Bold', 10)
+        canvas_obj.setFillColor(_C_NAVY)
         canvas_obj.drawString((self.page_width - page_width) / 2, footer_y, page_text)
 
         # Practice sheet identifier (right)
-        canvas_obj.setFillColor(colors.HexColor('#718096'))
+        canvas_obj.setFillColor(_C_GREY)
         canvas_obj.setFont('Helvetica', 8)
-        sheet_id = f"Worksheet #{random.randint(1000, 9999)}"
-        id_width = canvas_obj.stringWidth(sheet_id, 'Helvetica', 8)
+        if sheet_id is None:
+            sheet_id = f"Worksheet #{self._rng.randint(1000, 9999)}"
+        id_width = _sw(sheet_id, 'Helvetica', 8)
         canvas_obj.drawString(self.page_width - self.margin - id_width, footer_y, sheet_id)
 
-        # Bottom decorative line
-        canvas_obj.setStrokeColor(colors.HexColor('#1a365d'))
+        # === RULES ===
+        left, right = self.margin, self.page_width - self.margin
+
+        # Decorative lines above the header and below the footer
+        canvas_obj.setStrokeColor(_C_NAVY)
         canvas_obj.setLineWidth(2)
-        canvas_obj.line(self.margin, footer_y - 0.15*inch,
-                       self.page_width - self.margin, footer_y - 0.15*inch)
+        canvas_obj.lines([(left, header_y + _P15, right, header_y + _P15),
+                          (left, footer_y - _P15, right, footer_y - _P15)])
+
+        # Separators under the header and above the footer
+        canvas_obj.setStrokeColor(_C_SLATE)
+        canvas_obj.setLineWidth(0.5)
+        canvas_obj.lines([(left, header_y - _P50, right, header_y - _P50),
+                          (left, footer_y + _P25, right, footer_y + _P25)])
 
         canvas_obj.restoreState()
 
     def generate_worksheet(self, filename, num_problems=30, operation='+',
                           min_val=1, max_val=99, title=None, subtitle=None,
                           show_answers=False, mixed_operations=False):
-        """Generate a complete worksheet PDF for basic arithmetic."""
+        """
+        Generate a complete worksheet PDF for basic arithmetic.
+
+        ``filename`` may be a path or a writable binary file object.
+        """
 
         # Generate problems
-        problems = []
         if mixed_operations:
-            ops = ['+', '-', '×', '÷']
-            for _ in range(num_problems):
-                op = random.choice(ops)
-                problems.append(self.generate_problem(op, min_val, max_val))
+            op_column = self._rng.choices(['+', '-', '×', '÷'], k=num_problems)
+            batches = {op: self._generate_problems_batch(op_column.count(op), op,
+                                                         min_val, max_val)
+                       for op in dict.fromkeys(op_column)}
+
+            # Interleave the per-operation columns back into drawing order
+            taken = dict.fromkeys(batches, 0)
+            problems = {'top': [], 'bottom': [], 'operation': op_column, 'answer': []}
+            for op in op_column:
+                i = taken[op]
+                taken[op] += 1
+                for key in ('top', 'bottom', 'answer'):
+                    problems[key].append(batches[op][key][i])
         else:
-            for _ in range(num_problems):
-                problems.append(self.generate_problem(operation, min_val, max_val))
+            problems = self._generate_problems_batch(num_problems, operation, min_val, max_val)
+
+        # Drawing only needs the text of each column
+        tops = [str(v) for v in problems['top']]
+        bottoms = [str(v) for v in problems['bottom']]
+        ops = problems['operation']
+        answers = [str(v) for v in problems['answer']]
 
         # Setup title
         if title is None:
@@ -421,24 +603,36 @@ class ArithmeticPracticeGenerator:
         if show_answers:
             total_pages *= 2  # Double for answer key
 
-        # Create PDF
-        c = canvas.Canvas(filename, pagesize=letter)
+        # Create PDF in memory; it is written out in one go once complete
+        buf = io.BytesIO()
+        c = _FastCanvas(buf, pagesize=letter)
+        sheet_id = f"Worksheet #{self._rng.randint(1000, 9999)}"
+        now = datetime.now()
+        date_str = now.strftime("%B %d, %Y")
 
         current_page = 1
         problem_idx = 0
 
         # Content area dimensions
-        content_top = self.page_height - 1.5 * inch
-        content_bottom = 1 * inch
+        content_top = self.page_height - _P150
+        content_bottom = _P100
         content_left = self.margin
         content_width = self.page_width - 2 * self.margin
 
         cell_width = content_width / self.problems_per_row
         row_height = (content_top - content_bottom) / self.rows_per_page
 
+        # Cell origins are the same on every page
+        x_offsets = [content_left + col * cell_width + _P10
+                     for col in range(self.problems_per_row)]
+        y_offsets = [content_top - (row + 1) * row_height + _P30
+                     for row in range(self.rows_per_page)]
+
         while problem_idx < num_problems:
             # Draw header and footer
-            self.create_header_footer(c, None, current_page, total_pages, title, subtitle)
+            self.create_header_footer(c, None, current_page, total_pages, title, subtitle,
+                                      sheet_id, date_str, now.year)
+            rules = []
 
             # Draw problems for this page
             for row in range(self.rows_per_page):
@@ -446,28 +640,30 @@ class ArithmeticPracticeGenerator:
                     if problem_idx >= num_problems:
                         break
 
-                    prob = problems[problem_idx]
-                    x = content_left + col * cell_width + 0.1 * inch
-                    y = content_top - (row + 1) * row_height + 0.3 * inch
+                    x = x_offsets[col]
+                    y = y_offsets[row]
 
                     # Draw problem number
-                    c.setFillColor(colors.HexColor('#1a365d'))
+                    c.setFillColor(_C_NAVY)
                     c.setFont('Helvetica-Bold', 9)
-                    c.drawString(x, y + 0.55*inch, f"{problem_idx + 1}.")
+                    c.drawString(x, y + _P55, f"{problem_idx + 1}.")
 
                     # Draw the vertical problem
-                    self._draw_vertical_problem(c, prob, x + 0.25*inch, y, show_answer=False)
+                    rules.append(self._draw_vertical_problem(
+                        c, tops[problem_idx], bottoms[problem_idx], ops[problem_idx],
+                        answers[problem_idx], x + _P25, y, show_answer=False))
 
                     # Draw box for answer
-                    c.setStrokeColor(colors.HexColor('#e2e8f0'))
+                    c.setStrokeColor(_C_LIGHT)
                     c.setLineWidth(0.5)
-                    c.roundRect(x + 0.1*inch, y - 0.35*inch, cell_width - 0.3*inch, 0.3*inch, 3)
+                    c.roundRect(x + _P10, y - _P35, cell_width - _P30, _P30, 3)
 
                     problem_idx += 1
 
                 if problem_idx >= num_problems:
                     break
 
+            self._draw_rules(c, rules)
             c.showPage()
             current_page += 1
 
@@ -476,38 +672,46 @@ class ArithmeticPracticeGenerator:
             problem_idx = 0
             while problem_idx < num_problems:
                 self.create_header_footer(c, None, current_page, total_pages,
-                                         f"{title} - ANSWER KEY", "For teacher use only")
+                                         f"{title} - ANSWER KEY", "For teacher use only",
+                                         sheet_id, date_str, now.year)
+                rules = []
 
                 for row in range(self.rows_per_page):
                     for col in range(self.problems_per_row):
                         if problem_idx >= num_problems:
                             break
 
-                        prob = problems[problem_idx]
-                        x = content_left + col * cell_width + 0.1 * inch
-                        y = content_top - (row + 1) * row_height + 0.3 * inch
+                        x = x_offsets[col]
+                        y = y_offsets[row]
 
-                        c.setFillColor(colors.HexColor('#1a365d'))
+                        c.setFillColor(_C_NAVY)
                         c.setFont('Helvetica-Bold', 9)
-                        c.drawString(x, y + 0.55*inch, f"{problem_idx + 1}.")
+                        c.drawString(x, y + _P55, f"{problem_idx + 1}.")
 
-                        self._draw_vertical_problem(c, prob, x + 0.25*inch, y, show_answer=True)
+                        rules.append(self._draw_vertical_problem(
+                            c, tops[problem_idx], bottoms[problem_idx], ops[problem_idx],
+                            answers[problem_idx], x + _P25, y, show_answer=True))
 
                         problem_idx += 1
 
                     if problem_idx >= num_problems:
                         break
 
+                self._draw_rules(c, rules)
                 c.showPage()
                 current_page += 1
 
         c.save()
-        print(f"Worksheet saved to: {filename}")
+        _write_pdf(filename, buf.getvalue(), "Worksheet")
         return filename
 
     def generate_powers_worksheet(self, filename, num_problems=20, level='intermediate',
                                   title=None, subtitle=None, show_answers=False):
-        """Generate a powers of ten / scientific notation worksheet."""
+        """
+        Generate a powers of ten / scientific notation worksheet.
+
+        ``filename`` may be a path or a writable binary file object.
+        """
 
         # Generate problems
         problems = []
@@ -535,23 +739,36 @@ class ArithmeticPracticeGenerator:
         if show_answers:
             total_pages *= 2
 
-        # Create PDF
-        c = canvas.Canvas(filename, pagesize=letter)
+        # Create PDF in memory; it is written out in one go once complete
+        buf = io.BytesIO()
+        c = _FastCanvas(buf, pagesize=letter)
+        sheet_id = f"Worksheet #{self._rng.randint(1000, 9999)}"
+        now = datetime.now()
+        date_str = now.strftime("%B %d, %Y")
 
         current_page = 1
         problem_idx = 0
 
         # Content area dimensions
-        content_top = self.page_height - 1.5 * inch
-        content_bottom = 1 * inch
+        content_top = self.page_height - _P150
+        content_bottom = _P100
         content_left = self.margin
         content_width = self.page_width - 2 * self.margin
 
         cell_width = content_width / problems_per_row
         row_height = (content_top - content_bottom) / rows_per_page
 
+        # Cell origins are the same on every page
+        x_offsets = [content_left + col * cell_width + _P15
+                     for col in range(problems_per_row)]
+        y_offsets = [content_top - (row + 1) * row_height + _P40
+                     for row in range(rows_per_page)]
+
         while problem_idx < num_problems:
-            self.create_header_footer(c, None, current_page, total_pages, title, subtitle)
+            self.create_header_footer(c, None, current_page, total_pages, title, subtitle,
+                                      sheet_id, date_str, now.year)
+            rules = []
+            answer_lines = []
 
             for row in range(rows_per_page):
                 for col in range(problems_per_row):
@@ -559,30 +776,33 @@ class ArithmeticPracticeGenerator:
                         break
 
                     prob = problems[problem_idx]
-                    x = content_left + col * cell_width + 0.15 * inch
-                    y = content_top - (row + 1) * row_height + 0.4 * inch
+                    x = x_offsets[col]
+                    y = y_offsets[row]
 
                     # Draw problem number
-                    c.setFillColor(colors.HexColor('#1a365d'))
+                    c.setFillColor(_C_NAVY)
                     c.setFont('Helvetica-Bold', 11)
-                    c.drawString(x, y + 0.5*inch, f"{problem_idx + 1}.")
+                    c.drawString(x, y + _P50, f"{problem_idx + 1}.")
 
                     # Draw the problem
-                    self._draw_powers_problem(c, prob, x + 0.3*inch, y, show_answer=False)
-
-                    # Draw answer line
-                    c.setStrokeColor(colors.HexColor('#cbd5e0'))
-                    c.setLineWidth(1)
-                    c.line(x + 0.3*inch, y - 0.35*inch, x + cell_width - 0.4*inch, y - 0.35*inch)
-                    c.setFillColor(colors.HexColor('#718096'))
+                    rule = self._draw_powers_problem(c, prob, x + _P30, y, show_answer=False)
+                    if rule:
+                        rules.append(rule)
+
+                    # Answer line (stroked with the rest of the page's)
+                    answer_lines.append((x + _P30, y - _P35,
+                                         x + cell_width - _P40, y - _P35))
+                    c.setFillColor(_C_GREY)
                     c.setFont('Helvetica', 8)
-                    c.drawString(x + 0.3*inch, y - 0.5*inch, "Answer:")
+                    c.drawString(x + _P30, y - _P50, "Answer:")
 
                     problem_idx += 1
 
                 if problem_idx >= num_problems:
                     break
 
+            self._draw_rules(c, rules)
+            self._draw_rules(c, answer_lines, _C_SLATE, 1)
             c.showPage()
             current_page += 1
 
@@ -591,7 +811,9 @@ class ArithmeticPracticeGenerator:
             problem_idx = 0
             while problem_idx < num_problems:
                 self.create_header_footer(c, None, current_page, total_pages,
-                                         f"{title} - ANSWER KEY", "For teacher use only")
+                                         f"{title} - ANSWER KEY", "For teacher use only",
+                                         sheet_id, date_str, now.year)
+                rules = []
 
                 for row in range(rows_per_page):
                     for col in range(problems_per_row):
@@ -599,72 +821,86 @@ class ArithmeticPracticeGenerator:
                             break
 
                         prob = problems[problem_idx]
-                        x = content_left + col * cell_width + 0.15 * inch
-                        y = content_top - (row + 1) * row_height + 0.4 * inch
+                        x = x_offsets[col]
+                        y = y_offsets[row]
 
-                        c.setFillColor(colors.HexColor('#1a365d'))
+                        c.setFillColor(_C_NAVY)
                         c.setFont('Helvetica-Bold', 11)
-                        c.drawString(x, y + 0.5*inch, f"{problem_idx + 1}.")
+                        c.drawString(x, y + _P50, f"{problem_idx + 1}.")
 
-                        self._draw_powers_problem(c, prob, x + 0.3*inch, y, show_answer=True)
+                        rule = self._draw_powers_problem(c, prob, x + _P30, y, show_answer=True)
+                        if rule:
+                            rules.append(rule)
 
                         problem_idx += 1
 
                     if problem_idx >= num_problems:
                         break
 
+                self._draw_rules(c, rules)
                 c.showPage()
                 current_page += 1
 
         c.save()
-        print(f"Powers worksheet saved to: {filename}")
+        _write_pdf(filename, buf.getvalue(), "Powers worksheet")
         return filename
 
-    def _draw_vertical_problem(self, canvas_obj, problem, x, y, show_answer=False):
-        """Draw a single vertical arithmetic problem on the canvas."""
-        top = str(problem['top'])
-        bottom = str(problem['bottom'])
-        op = problem['operation']
-        answer = str(problem['answer'])
+    def _draw_vertical_problem(self, canvas_obj, top, bottom, op, answer, x, y,
+                               show_answer=False):
+        """
+        Draw a single vertical arithmetic problem on the canvas.
 
-        max_len = max(len(top), len(bottom), len(answer))
+        ``top``, ``bottom`` and ``answer`` are the already-formatted numbers.
 
-        # Set font
-        canvas_obj.setFont('Courier-Bold', 14)
-        canvas_obj.setFillColor(colors.black)
+        All of the problem's text goes out in a single text object. The rule
+        under the bottom number is returned as an ``(x1, y1, x2, y2)`` tuple so
+        the caller can stroke every rule on the page with one ``lines()`` call.
+        """
+        max_len = max(len(top), len(bottom), len(answer))
 
         char_width = 8.4  # Approximate width for Courier-Bold 14
 
         # Calculate positions for right-alignment
         line_width = (max_len + 1) * char_width + 10
 
-        # Draw top number (right-aligned)
-        top_x = x + line_width - len(top) * char_width
-        canvas_obj.drawString(top_x, y + 0.35*inch, top)
+        t = canvas_obj.beginText()
+        t.setFont('Courier-Bold', 14)
+        t.setFillColor(colors.black)
 
-        # Draw operator and bottom number
-        canvas_obj.drawString(x, y + 0.15*inch, op)
-        bottom_x = x + line_width - len(bottom) * char_width
-        canvas_obj.drawString(bottom_x, y + 0.15*inch, bottom)
+        # Top number (right-aligned)
+        t.setTextOrigin(x + line_width - len(top) * char_width, y + _P35)
+        t.textOut(top)
 
-        # Draw line
-        canvas_obj.setStrokeColor(colors.black)
-        canvas_obj.setLineWidth(1.5)
-        canvas_obj.line(x, y + 0.05*inch, x + line_width, y + 0.05*inch)
+        # Operator and bottom number
+        t.setTextOrigin(x, y + _P15)
+        t.textOut(op)
+        t.setTextOrigin(x + line_width - len(bottom) * char_width, y + _P15)
+        t.textOut(bottom)
 
-        # Draw answer if requested
+        # Answer if requested
         if show_answer:
-            canvas_obj.setFillColor(colors.HexColor('#c53030'))  # Red for answers
-            answer_x = x + line_width - len(answer) * char_width
-            canvas_obj.drawString(answer_x, y - 0.15*inch, answer)
+            t.setFillColor(_C_RED)  # Red for answers
+            t.setTextOrigin(x + line_width - len(answer) * char_width, y - _P15)
+            t.textOut(answer)
+
+        canvas_obj.drawText(t)
+
+        return (x, y + _P05, x + line_width, y + _P05)
 
     def _draw_powers_problem(self, canvas_obj, problem, x, y, show_answer=False):
-        """Draw a powers of ten problem on the canvas."""
-        expression = problem['expression']
-        answer = problem['answer']
-        is_fraction = problem.get('is_fraction', False)
+        """
+        Draw a powers of ten problem on the canvas.
 
-        canvas_obj.setFillColor(colors.black)
+        Returns the fraction bar as an ``(x1, y1, x2, y2)`` tuple, or ``None``
+        for horizontal expressions, so the caller can batch-stroke the page.
+        """
+        expression = problem.expression
+        answer = problem.answer
+        is_fraction = problem.is_fraction
+
+        t = canvas_obj.beginText()
+        t.setFillColor(colors.black)
+        rule = None
 
         if is_fraction and isinstance(expression, dict):
             # Draw as vertical fraction
@@ -672,52 +908,62 @@ class ArithmeticPracticeGenerator:
             denominator = expression['denominator']
 
             # Calculate widths
-            canvas_obj.setFont('Helvetica', 12)
-            num_width = canvas_obj.stringWidth(numerator, 'Helvetica', 12)
-            den_width = canvas_obj.stringWidth(denominator, 'Helvetica', 12)
+            t.setFont('Helvetica', 12)
+            num_width = _sw(numerator, 'Helvetica', 12)
+            den_width = _sw(denominator, 'Helvetica', 12)
             max_width = max(num_width, den_width) + 20
 
-            # Draw numerator (centered)
-            num_x = x + (max_width - num_width) / 2
-            canvas_obj.drawString(num_x, y + 0.25*inch, numerator)
+            # Numerator (centered)
+            t.setTextOrigin(x + (max_width - num_width) / 2, y + _P25)
+            t.textOut(numerator)
 
-            # Draw fraction line
-            canvas_obj.setStrokeColor(colors.black)
-            canvas_obj.setLineWidth(1.5)
-            canvas_obj.line(x, y + 0.1*inch, x + max_width, y + 0.1*inch)
+            # Fraction line
+            rule = (x, y + _P10, x + max_width, y + _P10)
 
-            # Draw denominator (centered)
-            den_x = x + (max_width - den_width) / 2
-            canvas_obj.drawString(den_x, y - 0.1*inch, denominator)
+            # Denominator (centered)
+            t.setTextOrigin(x + (max_width - den_width) / 2, y - _P10)
+            t.textOut(denominator)
 
-            # Draw equals and answer if showing
+            # Equals and answer if showing
             if show_answer:
-                canvas_obj.setFont('Helvetica-Bold', 12)
-                canvas_obj.drawString(x + max_width + 10, y + 0.05*inch, "=")
-                canvas_obj.setFillColor(colors.HexColor('#c53030'))
-                canvas_obj.drawString(x + max_width + 25, y + 0.05*inch, answer)
+                t.setFont('Helvetica-Bold', 12)
+                t.setTextOrigin(x + max_width + 10, y + _P05)
+                t.textOut("=")
+                t.setFillColor(_C_RED)
+                t.setTextOrigin(x + max_width + 25, y + _P05)
+                t.textOut(answer)
         else:
-            # Draw horizontal expression
-            canvas_obj.setFont('Helvetica', 13)
-            canvas_obj.drawString(x, y + 0.15*inch, expression)
+            # Horizontal expression
+            t.setFont('Helvetica', 13)
+            t.setTextOrigin(x, y + _P15)
+            t.textOut(expression)
 
-            # Draw answer if showing
+            # Answer if showing
             if show_answer:
-                expr_width = canvas_obj.stringWidth(expression, 'Helvetica', 13)
-                canvas_obj.setFont('Helvetica-Bold', 13)
-                canvas_obj.drawString(x + expr_width + 15, y + 0.15*inch, "=")
-                canvas_obj.setFillColor(colors.HexColor('#c53030'))
-                canvas_obj.drawString(x + expr_width + 30, y + 0.15*inch, answer)
+                expr_width = _sw(expression, 'Helvetica', 13)
+                t.setFont('Helvetica-Bold', 13)
+                t.setTextOrigin(x + expr_width + 15, y + _P15)
+                t.textOut("=")
+                t.setFillColor(_C_RED)
+                t.setTextOrigin(x + expr_width + 30, y + _P15)
+                t.textOut(answer)
 
+        canvas_obj.drawText(t)
 
-def main():
-    """Example usage of the ArithmeticPracticeGenerator."""
-    generator = ArithmeticPracticeGenerator(school_name="Lexington Science Academy")
+        return rule
+
+    def _draw_rules(self, canvas_obj, rules, color=colors.black, width=1.5):
+        """Stroke the rules collected for a page in one pass."""
+        if rules:
+            canvas_obj.setStrokeColor(color)
+            canvas_obj.setLineWidth(width)
+            canvas_obj.lines(rules)
 
-    print("Generating arithmetic practice worksheets...\n")
 
+# Worksheets produced by main(): (generator method name, keyword arguments)
+JOBS = [
     # Addition worksheet
-    generator.generate_worksheet(
+    ("generate_worksheet", dict(
         filename="addition_practice.pdf",
         num_problems=30,
         operation='+',
@@ -726,10 +972,9 @@ def main():
         title="Addition Practice",
         subtitle="Add the numbers. Write your answer below the line.",
         show_answers=True
-    )
-
+    )),
     # Subtraction worksheet
-    generator.generate_worksheet(
+    ("generate_worksheet", dict(
         filename="subtraction_practice.pdf",
         num_problems=30,
         operation='-',
@@ -738,10 +983,9 @@ def main():
         title="Subtraction Practice",
         subtitle="Subtract the numbers. Write your answer below the line.",
         show_answers=True
-    )
-
+    )),
     # Multiplication worksheet
-    generator.generate_worksheet(
+    ("generate_worksheet", dict(
         filename="multiplication_practice.pdf",
         num_problems=30,
         operation='×',
@@ -750,10 +994,9 @@ def main():
         title="Multiplication Practice",
         subtitle="Multiply the numbers. Show your work!",
         show_answers=True
-    )
-
+    )),
     # Division worksheet
-    generator.generate_worksheet(
+    ("generate_worksheet", dict(
         filename="division_practice.pdf",
         num_problems=30,
         operation='÷',
@@ -762,10 +1005,9 @@ def main():
         title="Division Practice",
         subtitle="Divide the numbers. All answers are whole numbers.",
         show_answers=True
-    )
-
+    )),
     # Mixed operations worksheet
-    generator.generate_worksheet(
+    ("generate_worksheet", dict(
         filename="mixed_operations_practice.pdf",
         num_problems=40,
         mixed_operations=True,
@@ -774,48 +1016,62 @@ def main():
         title="Mixed Operations Challenge",
         subtitle="Complete each problem. Pay attention to the operation sign!",
         show_answers=True
-    )
-
+    )),
     # Powers of Ten worksheets
-    print("\nGenerating powers of ten worksheets...\n")
-
-    generator.generate_powers_worksheet(
+    ("generate_powers_worksheet", dict(
         filename="powers_of_ten_basic.pdf",
         num_problems=20,
         level='basic',
         title="Powers of Ten - Basic",
         subtitle="Simplify each expression. Write answers in standard or scientific notation.",
         show_answers=True
-    )
-
-    generator.generate_powers_worksheet(
+    )),
+    ("generate_powers_worksheet", dict(
         filename="powers_of_ten_intermediate.pdf",
         num_problems=16,
         level='intermediate',
         title="Scientific Notation Practice",
         subtitle="Simplify each expression. Express answers in scientific notation.",
         show_answers=True
-    )
-
-    generator.generate_powers_worksheet(
+    )),
+    ("generate_powers_worksheet", dict(
         filename="powers_of_ten_advanced.pdf",
         num_problems=12,
         level='advanced',
         title="Scientific Notation - Advanced",
         subtitle="Simplify each expression. Express answers in proper scientific notation.",
         show_answers=True
-    )
-
-    print("\nAll worksheets generated successfully!")
-    print("\nGenerated files:")
-    print("  - addition_practice.pdf")
-    print("  - subtraction_practice.pdf")
-    print("  - multiplication_practice.pdf")
-    print("  - division_practice.pdf")
-    print("  - mixed_operations_practice.pdf")
-    print("  - powers_of_ten_basic.pdf")
-    print("  - powers_of_ten_intermediate.pdf")
-    print("  - powers_of_ten_advanced.pdf")
+    )),
+]
+
+
+def _run(job):
+    """Generate one worksheet from a ``(method_name, kwargs)`` job in a worker process."""
+    method_name, kwargs = job
+    generator = ArithmeticPracticeGenerator(school_name="Lexington Science Academy")
+    return getattr(generator, method_name)(**kwargs)
+
+
+def main():
+    """Example usage of the ArithmeticPracticeGenerator."""
+    print("Generating practice worksheets...\n")
+
+    # Each worksheet is independent, so render them in parallel. Every job
+    # builds its own generator, and with it a freshly seeded random source.
+    # There is no point starting more workers than there are worksheets, and
+    # with only one there is no point starting a pool at all.
+    workers = min(len(JOBS), os.cpu_count() or 1)
+    if workers == 1:
+        for job in JOBS:
+            _run(job)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_run, JOBS))
+
+    # Summary in a single write, listing exactly the files the jobs produced
+    summary = ["", "All worksheets generated successfully!", "", "Generated files:"]
+    summary += [f"  - {kwargs['filename']}" for _, kwargs in JOBS]
+    sys.stdout.write("\n".join(summary) + "\n")
 
 
 if __name__ == "__main__":